@@ -21,18 +21,22 @@ Architecture note:
   All gt commands are run from TOWN_DIR (~/gt/) to ensure correct routing.
 """
 
-import json
+# json, http.client and urllib.* are imported where used: preflight failures
+# and non-query phases don't pay for them.
+import atexit
+import functools
 import os
+import re
 import shutil
 import signal
 import subprocess
 import sys
+import threading
 import time
-import urllib.parse
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 # ── Config ────────────────────────────────────────────────────────────────────
 
@@ -53,10 +57,19 @@ GRAFANA_URL = "http://localhost:9429"
 TRACE_PORT  = 7428
 TRACE_URL   = f"http://localhost:{TRACE_PORT}"
 
-CONVOY_TIMEOUT = int(os.environ.get("CONVOY_TIMEOUT", "3600"))
-CONVOY_POLL    = 30
+CONVOY_TIMEOUT  = int(os.environ.get("CONVOY_TIMEOUT", "3600"))
+CONVOY_POLL_MIN = 2    # first poll interval; grows ×1.5 per miss …
+CONVOY_POLL     = 30   # … up to this cap
+
+# `gt mayor status` output (bytes) that means the Mayor is up.
+_MAYOR_READY_RE = re.compile(rb"running|active", re.I)
+
+# Max concurrent HTTP queries against VictoriaMetrics / VictoriaLogs.
+QUERY_WORKERS = 16
 
 # OTEL environment variables injected into every gt/bd command.
+# main() exports them into os.environ once, so child processes simply
+# inherit them instead of receiving a rebuilt env dict on every spawn.
 OTEL_VARS: dict[str, str] = {
     "GT_OTEL_METRICS_URL":                  f"{VM_URL}/opentelemetry/api/v1/push",
     "GT_OTEL_LOGS_URL":                     f"{VL_URL}/insert/opentelemetry/v1/logs",
@@ -75,21 +88,27 @@ OTEL_VARS: dict[str, str] = {
     "OTEL_LOG_USER_PROMPTS":                "true",
 }
 
-GT_ENV = {**os.environ, **OTEL_VARS}
-
 # ── Logging ────────────────────────────────────────────────────────────────────
 
+_ts_cache: tuple[int, str] = (-1, "")
+
 def ts() -> str:
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    """Current local time, formatted at most once per wall-clock second."""
+    global _ts_cache
+    sec = int(time.time())
+    if sec != _ts_cache[0]:
+        # Swapped as one tuple so concurrent phases never see a torn pair.
+        _ts_cache = (sec, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec)))
+    return _ts_cache[1]
 
-_log_file: Optional[Path] = None
+# Append-only fd for run.log, opened once by main(); one write(2) per line.
+_log_fd: Optional[int] = None
 
 def log(msg: str) -> None:
     line = f"[{ts()}] {msg}"
     print(line, flush=True)
-    if _log_file:
-        with _log_file.open("a") as f:
-            f.write(line + "\n")
+    if _log_fd is not None:
+        os.write(_log_fd, (line + "\n").encode())
 
 def section(name: str) -> None:
     log(f"══ {name}")
@@ -103,12 +122,15 @@ class Report:
 
     def __init__(self, path: Path, title: str) -> None:
         self.path = path
-        self._f = path.open("w")
+        # Large buffer: rows and headers are coalesced and only hit the file
+        # at phase boundaries (status/close).
+        # Binary so captured command output (bytes) is written without a
+        # decode/encode round-trip.
+        self._f = path.open("wb", buffering=1 << 16)
         self.write(f"# {title}\n\n> Started: {ts()}\n\n")
 
-    def write(self, text: str) -> "Report":
-        self._f.write(text)
-        self._f.flush()
+    def write(self, text: Union[str, bytes]) -> "Report":
+        self._f.write(text if isinstance(text, bytes) else text.encode())
         return self
 
     def h2(self, text: str) -> "Report":
@@ -123,27 +145,38 @@ class Report:
     def blockquote(self, text: str) -> "Report":
         return self.write(f"> {text}\n\n")
 
-    def code(self, content: str, lang: str = "") -> "Report":
-        return self.write(f"```{lang}\n{content.rstrip()}\n```\n\n")
+    def code(self, content: Union[str, bytes], lang: str = "") -> "Report":
+        self.write(f"```{lang}\n")
+        self.write(content.rstrip())
+        return self.write("\n```\n\n")
 
-    def cmd(self, cmd_str: str, output: str) -> "Report":
-        return self.code(f"$ {cmd_str}\n{output.rstrip()}")
+    def cmd(self, cmd_str: str, output: Union[str, bytes]) -> "Report":
+        output = output.rstrip()
+        self.write(f"```\n$ {cmd_str}" + ("\n" if output else ""))
+        self.write(output)
+        return self.write("\n```\n\n")
 
     def table(self, headers: list[str], rows: list[list]) -> "Report":
-        widths = [max(len(str(h)), max((len(str(r[i])) for r in rows), default=0))
-                  for i, h in enumerate(headers)]
+        # Stringify each cell once, then size columns in a single pass.
+        srows = [[str(c) for c in row] for row in rows]
+        widths = [len(str(h)) for h in headers]
+        for row in srows:
+            for i, c in enumerate(row[:len(widths)]):
+                widths[i] = max(widths[i], len(c))
         def row_str(cells):
-            return "| " + " | ".join(str(c).ljust(w) for c, w in zip(cells, widths)) + " |"
+            return "| " + " | ".join(c.ljust(w) for c, w in zip(cells, widths)) + " |"
         sep = "|" + "|".join("-" * (w + 2) for w in widths) + "|"
-        self.write(row_str(headers) + "\n" + sep + "\n")
-        for row in rows:
+        self.write(row_str([str(h) for h in headers]) + "\n" + sep + "\n")
+        for row in srows:
             self.write(row_str(row) + "\n")
         return self.write("\n")
 
     def status(self, ok: bool, msg: str = "") -> "Report":
         icon = "✓" if ok else "⚠"
         label = msg or ("OK" if ok else "FAILED")
-        return self.write(f"> {icon} **{label}** — {ts()}\n\n")
+        self.write(f"> {icon} **{label}** — {ts()}\n\n")
+        self._f.flush()
+        return self
 
     def close(self, ok: bool = True) -> None:
         self.status(ok, "Completed" if ok else "Phase failed — see details above")
@@ -176,45 +209,144 @@ def run_cmd(
     return result.returncode, result.stdout or ""
 
 
-def run_compose(args: list[str]) -> tuple[int, str]:
-    return run_cmd(["docker", "compose", "-f", str(COMPOSE_FILE)] + args)
+def run_cmd_bytes(
+    cmd: list[str],
+    cwd: Optional[Path] = None,
+    env: Optional[dict] = None,
+) -> tuple[int, bytes]:
+    """Like run_cmd, but keep the output undecoded (for report-only captures)."""
+    result = subprocess.run(
+        cmd,
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    return result.returncode, result.stdout or b""
+
+
+def run_compose(args: list[str]) -> tuple[int, bytes]:
+    return run_cmd_bytes(["docker", "compose", "-f", str(COMPOSE_FILE)] + args)
 
 
 def run_gt(args: list[str], stdin_text: Optional[str] = None) -> tuple[int, str]:
-    """Run a gt command from the global town root with OTEL environment."""
-    return run_cmd(["gt"] + args, cwd=TOWN_DIR, env=GT_ENV, stdin_text=stdin_text)
+    """Run a gt command from the global town root (OTEL env is inherited)."""
+    return run_cmd(["gt"] + args, cwd=TOWN_DIR, stdin_text=stdin_text)
+
+
+def run_gt_bytes(args: list[str]) -> tuple[int, bytes]:
+    """run_gt for output that only ends up in a report."""
+    return run_cmd_bytes(["gt"] + args, cwd=TOWN_DIR)
+
 
+def wait_for_http(url: str, label: str, timeout: float = 60.0) -> bool:
+    """HEAD-poll url with exponential backoff (0.1s → 2s) until it answers 2xx."""
+    import urllib.error
+    import urllib.request
 
-def wait_for_http(url: str, label: str, retries: int = 30, delay: int = 2) -> bool:
     log(f"Waiting for {label} ({url})…")
-    for i in range(retries):
+    req = urllib.request.Request(url, method="HEAD")
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+    while True:
         try:
-            urllib.request.urlopen(url, timeout=3)
+            urllib.request.urlopen(req, timeout=1).close()
             log(f"{label} ready")
             return True
+        except urllib.error.HTTPError as e:
+            if e.code == 405:   # up, but HEAD not routed — good enough
+                log(f"{label} ready")
+                return True
         except Exception:
-            time.sleep(delay)
-    log(f"WARNING: {label} not ready after {retries * delay}s")
+            pass
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(delay, remaining))
+        delay = min(2.0, delay * 1.6)
+    log(f"WARNING: {label} not ready after {timeout:g}s")
     return False
 
 # ── OTEL query helpers ────────────────────────────────────────────────────────
 
+# Keep-alive connections shared by all threads: idle sockets per host are
+# checked out for one request and returned afterwards, so they outlive the
+# per-phase query pools. http.client connections are not thread-safe, hence
+# one request per connection at a time.
+_http_idle: dict[str, list] = {}
+_http_lock = threading.Lock()
+
+
+def _http_checkout(netloc: str):
+    """Return (connection, reused) — an idle pooled socket or a new one."""
+    import http.client
+
+    with _http_lock:
+        idle = _http_idle.get(netloc)
+        if idle:
+            return idle.pop(), True
+    return http.client.HTTPConnection(netloc, timeout=10), False
+
+
+def _http_checkin(netloc: str, conn) -> None:
+    with _http_lock:
+        _http_idle.setdefault(netloc, []).append(conn)
+
+
+def close_http_pool() -> None:
+    """Close every idle pooled connection."""
+    with _http_lock:
+        conns = [c for idle in _http_idle.values() for c in idle]
+        _http_idle.clear()
+    for conn in conns:
+        conn.close()
+
+
+atexit.register(close_http_pool)
+
+
 def http_get(url: str, params: Optional[dict] = None) -> Optional[str]:
-    full = url + ("?" + urllib.parse.urlencode(params) if params else "")
-    try:
-        with urllib.request.urlopen(full, timeout=10) as resp:
-            return resp.read().decode()
-    except Exception:
+    import urllib.parse
+
+    parts = urllib.parse.urlsplit(url)
+    path = (parts.path or "/") + ("?" + urllib.parse.urlencode(params) if params else "")
+    while True:
+        conn, reused = _http_checkout(parts.netloc)
+        try:
+            conn.request("GET", path)
+            resp = conn.getresponse()
+            body = resp.read().decode()
+        except ConnectionResetError:
+            # Covers http.client.RemoteDisconnected: the server dropped an
+            # idle keep-alive socket. Retry on a fresh one; never on timeouts.
+            conn.close()
+            if reused:
+                continue
+            return None
+        except Exception:
+            conn.close()
+            return None
+        if resp.will_close:
+            conn.close()
+        else:
+            _http_checkin(parts.netloc, conn)
+        return body if resp.status == 200 else None
+
+
+def _vm_results(q: str) -> Optional[list]:
+    """Decoded `data.result` list for an instant PromQL query, None if unreachable."""
+    import json
+
+    body = http_get(f"{VM_URL}/api/v1/query", {"query": q})
+    if not body:
         return None
+    return json.loads(body).get("data", {}).get("result", [])
 
 
 def vm_query(q: str) -> str:
     """Instant PromQL query → formatted string."""
-    body = http_get(f"{VM_URL}/api/v1/query", {"query": q})
-    if not body:
-        return "  (no data)"
     try:
-        results = json.loads(body).get("data", {}).get("result", [])
+        results = _vm_results(q)
         if not results:
             return "  (no data)"
         lines = []
@@ -232,26 +364,35 @@ def vm_query(q: str) -> str:
 
 def vm_scalar(q: str) -> float:
     """Return a single numeric value from VictoriaMetrics, or 0."""
-    body = http_get(f"{VM_URL}/api/v1/query", {"query": q})
-    if not body:
-        return 0.0
     try:
-        results = json.loads(body).get("data", {}).get("result", [])
+        results = _vm_results(q)
         return float(results[0]["value"][1]) if results else 0.0
     except Exception:
         return 0.0
 
 
 def vl_count(q: str) -> int:
-    """Count matching events in VictoriaLogs (NDJSON, one object per line)."""
-    body = http_get(f"{VL_URL}/select/logsql/query", {"query": q, "limit": "10000"})
+    """Count matching events in VictoriaLogs, or -1 on failure.
+
+    Counted server-side via a LogsQL `stats count()` pipe, so only a single
+    Prometheus-style sample comes back instead of every matching log line.
+    """
+    import json
+
+    body = http_get(f"{VL_URL}/select/logsql/stats_query", {"query": f"{q} | stats count() as n"})
     if body is None:
         return -1
-    return len([l for l in body.splitlines() if l.strip()])
+    try:
+        results = json.loads(body).get("data", {}).get("result", [])
+        return int(float(results[0]["value"][1])) if results else 0
+    except Exception:
+        return -1
 
 # ── Convoy helpers ────────────────────────────────────────────────────────────
 
 def convoy_landed() -> bool:
+    import json
+
     rc, output = run_gt(["convoy", "list", "--all", "--json"])
     if rc != 0 or not output.strip():
         return False
@@ -268,6 +409,13 @@ def convoy_landed() -> bool:
         pass
     return False
 
+# ── Prompt ────────────────────────────────────────────────────────────────────
+
+@functools.lru_cache(maxsize=1)
+def prompt_text() -> str:
+    """PROMPT1.md content, read once per process."""
+    return PROMPT_FILE.read_text(encoding="utf-8")
+
 # ── Phase functions ───────────────────────────────────────────────────────────
 
 def phase1_reset_otel() -> None:
@@ -286,11 +434,18 @@ def phase1_reset_otel() -> None:
             f"{COMPOSE_PROJECT}_vl-data",
             f"{COMPOSE_PROJECT}_grafana-data",
         ]
-        rc, out = run_cmd(["docker", "volume", "rm"] + volumes)
-        r.cmd(f"docker volume rm {' '.join(volumes)}", out)
-
-        rc, out = run_cmd(["docker", "volume", "ls", "--filter", f"name={COMPOSE_PROJECT}"])
-        r.cmd(f"docker volume ls --filter name={COMPOSE_PROJECT}", out)
+        rc, out = run_cmd(["docker", "volume", "ls", "--filter", f"name={COMPOSE_PROJECT}", "-q"])
+        r.cmd(f"docker volume ls --filter name={COMPOSE_PROJECT} -q", out)
+
+        # Only remove what exists: skips a failing `docker volume rm` spawn
+        # on first runs or after a prune.
+        existing = set(out.split()) if rc == 0 else set(volumes)
+        to_remove = [v for v in volumes if v in existing]
+        if to_remove:
+            rc, out = run_cmd_bytes(["docker", "volume", "rm"] + to_remove)
+            r.cmd(f"docker volume rm {' '.join(to_remove)}", out)
+        else:
+            r.p("No volumes to remove.")
 
 
 def phase2_reset_gastown() -> None:
@@ -302,11 +457,11 @@ def phase2_reset_gastown() -> None:
         )
 
         r.h2("Mayor status before reset")
-        rc, out = run_gt(["mayor", "status"])
+        rc, out = run_gt_bytes(["mayor", "status"])
         r.code(out)
 
         r.h2("Stop Mayor")
-        rc, out = run_gt(["mayor", "stop"])
+        rc, out = run_gt_bytes(["mayor", "stop"])
         r.cmd("gt mayor stop", out)
 
 
@@ -320,17 +475,20 @@ def phase3_start_otel() -> tuple[subprocess.Popen, dict]:
         if rc != 0:
             r.blockquote(f"⚠ docker compose up returned {rc}")
 
-        vm_ok = wait_for_http(f"{VM_URL}/health", "VictoriaMetrics")
-        vl_ok = wait_for_http(f"{VL_URL}/health", "VictoriaLogs")
-
-        r.h2("gastown-trace")
+        # Spawn gastown-trace first so its startup overlaps the health waits.
         trace_log = (REPORTS_DIR / "gastown-trace.log").open("w")
         trace_proc = subprocess.Popen(
             [str(TRACE_BIN), "--logs", VL_URL, "--port", str(TRACE_PORT)],
             stdout=trace_log,
             stderr=subprocess.STDOUT,
         )
-        time.sleep(2)
+        trace_started = time.monotonic()
+
+        vm_ok = wait_for_http(f"{VM_URL}/health", "VictoriaMetrics")
+        vl_ok = wait_for_http(f"{VL_URL}/health", "VictoriaLogs")
+
+        r.h2("gastown-trace")
+        time.sleep(max(0.0, 2 - (time.monotonic() - trace_started)))
         alive = trace_proc.poll() is None
         r.p(f"PID {trace_proc.pid} → {TRACE_URL} — {'running' if alive else 'FAILED TO START'}")
 
@@ -358,14 +516,14 @@ def phase4_start_gastown() -> bool:
         r.p(f"Starting Mayor in global town: `{TOWN_DIR}`")
 
         r.h2("gt mayor start")
-        rc, out = run_gt(["mayor", "start"])
+        rc, out = run_gt_bytes(["mayor", "start"])
         r.cmd("gt mayor start", out)
 
         r.h2("Waiting for Mayor")
         log("Polling gt mayor status…")
         for i in range(30):
-            rc, out = run_gt(["mayor", "status"])
-            if rc == 0 and any(w in out.lower() for w in ("running", "active")):
+            rc, out = run_gt_bytes(["mayor", "status"])
+            if rc == 0 and _MAYOR_READY_RE.search(out):
                 mayor_ready = True
                 log("Mayor is running")
                 break
@@ -378,15 +536,21 @@ def phase4_start_gastown() -> bool:
 
 def phase5_launch_test() -> None:
     section("PHASE 5 — Inject PROMPT1.md → Mayor")
-    prompt = PROMPT_FILE.read_text()
+    prompt = prompt_text()
 
     with Report(REPORTS_DIR / "05-test-launch.md", "Phase 5 — Test Suite Launch") as r:
         r.h2("Prompt Content")
         r.write(prompt + "\n\n---\n\n")
 
         r.h2("Nudge delivery")
-        rc, out = run_gt(["nudge", "mayor", prompt])
-        r.cmd("gt nudge mayor <PROMPT1.md content>", out)
+        # Piped via stdin: a large prompt as argv risks ARG_MAX. Older gt
+        # builds reject --stdin, so fall back to passing it as an argument.
+        rc, out = run_gt(["nudge", "mayor", "--stdin"], stdin_text=prompt)
+        r.cmd("gt nudge mayor --stdin < PROMPT1.md", out)
+        if rc != 0 and "unknown flag" in out:
+            log("gt nudge has no --stdin — passing prompt as argument")
+            rc, out = run_gt(["nudge", "mayor", prompt])
+            r.cmd("gt nudge mayor <PROMPT1.md content>", out)
         r.status(rc == 0, "Nudge delivered" if rc == 0 else f"Nudge failed (rc={rc})")
 
 
@@ -394,10 +558,12 @@ def phase6_wait_convoy() -> tuple[bool, int]:
     section(f"PHASE 6 — Waiting for convoy (timeout: {CONVOY_TIMEOUT}s)")
     landed = False
     elapsed = 0
+    delay = CONVOY_POLL_MIN
+    start = time.monotonic()
 
     with Report(REPORTS_DIR / "06-test-results.md", "Phase 6 — Test Results") as r:
         r.blockquote(
-            f"Polling every {CONVOY_POLL}s, timeout {CONVOY_TIMEOUT}s"
+            f"Polling every {CONVOY_POLL_MIN}s → {CONVOY_POLL}s (backoff), timeout {CONVOY_TIMEOUT}s"
         )
         r.h2("Poll Log")
 
@@ -409,19 +575,22 @@ def phase6_wait_convoy() -> tuple[bool, int]:
                 break
             log(f"[{elapsed}/{CONVOY_TIMEOUT}s] Convoy not yet landed…")
             r.write(f"- `{datetime.now().strftime('%H:%M:%S')}` [{elapsed}s] — open\n")
-            time.sleep(CONVOY_POLL)
-            elapsed += CONVOY_POLL
+            # Short early intervals catch quick landings; back off so long
+            # runs don't hammer `gt convoy list`.
+            time.sleep(min(delay, max(0, CONVOY_TIMEOUT - elapsed)))
+            delay = min(CONVOY_POLL, delay * 1.5)
+            elapsed = int(time.monotonic() - start)
 
         r.h2("Convoy Status")
-        rc, out = run_gt(["convoy", "list", "--all"])
+        rc, out = run_gt_bytes(["convoy", "list", "--all"])
         r.code(out)
 
         r.h2("Doctor")
-        rc, out = run_gt(["doctor"])
+        rc, out = run_gt_bytes(["doctor"])
         r.code(out)
 
         r.h2("Recent Agent Activity")
-        rc, out = run_gt(["trail", "commits", "--limit", "20"])
+        rc, out = run_gt_bytes(["trail", "commits", "--limit", "20"])
         r.code(out)
 
         if landed:
@@ -436,7 +605,6 @@ def phase7_collect_otel() -> None:
     section("PHASE 7 — Collect OTEL metrics + logs")
     with Report(REPORTS_DIR / "07-otel-data.md", "Phase 7 — OTEL Data") as r:
 
-        r.h2("Gastown Metrics (VictoriaMetrics)")
         metrics = {
             "bd calls by subcommand":     "sum by (subcommand)(gastown_bd_calls_total)",
             "polecat spawns":             "gastown_polecat_spawns_total",
@@ -447,34 +615,16 @@ def phase7_collect_otel() -> None:
             "convoy creates":             "gastown_convoy_creates_total",
             "slings dispatched":          "gastown_sling_dispatches_total",
         }
-        lines = []
-        for label, q in metrics.items():
-            lines.append(f"{label}:\n{vm_query(q)}")
-        r.code("\n\n".join(lines))
-
-        r.h2("Token Usage")
         token_metrics = {
             "input tokens by model":   "sum by (model)(bd_ai_input_tokens_total)",
             "output tokens by model":  "sum by (model)(bd_ai_output_tokens_total)",
             "API latency P95 (ms)":    "histogram_quantile(0.95, bd_ai_request_duration_ms_bucket)",
         }
-        lines = []
-        for label, q in token_metrics.items():
-            lines.append(f"{label}:\n{vm_query(q)}")
-        r.code("\n\n".join(lines))
-
-        r.h2("bd Storage")
         storage_metrics = {
             "storage operations by type":  "sum by (operation)(bd_storage_operations_total)",
             "storage errors":              "bd_storage_errors_total",
             "issues by status":            "bd_issue_count",
         }
-        lines = []
-        for label, q in storage_metrics.items():
-            lines.append(f"{label}:\n{vm_query(q)}")
-        r.code("\n\n".join(lines))
-
-        r.h2("VictoriaLogs — Event Counts")
         vl_queries = {
             "All gastown events":    "service_name:gastown",
             "session.start":         'service_name:gastown AND "session.start"',
@@ -489,11 +639,27 @@ def phase7_collect_otel() -> None:
             "Claude API requests":   '"claude_code.api_request"',
             "Claude tool calls":     '"claude_code.tool_result"',
         }
-        rows = []
-        for label, q in vl_queries.items():
-            n = vl_count(q)
-            rows.append([label, str(n) if n >= 0 else "?"])
-        r.table(["Event type", "Count"], rows)
+
+        # Every query is an independent HTTP round-trip: submit them all up
+        # front so the phase costs ~1 RTT instead of one per query.
+        with ThreadPoolExecutor(max_workers=QUERY_WORKERS) as pool:
+            metric_results  = pool.map(vm_query, metrics.values())
+            token_results   = pool.map(vm_query, token_metrics.values())
+            storage_results = pool.map(vm_query, storage_metrics.values())
+            vl_results      = pool.map(vl_count, vl_queries.values())
+
+            r.h2("Gastown Metrics (VictoriaMetrics)")
+            r.code("\n\n".join(f"{label}:\n{out}" for label, out in zip(metrics, metric_results)))
+
+            r.h2("Token Usage")
+            r.code("\n\n".join(f"{label}:\n{out}" for label, out in zip(token_metrics, token_results)))
+
+            r.h2("bd Storage")
+            r.code("\n\n".join(f"{label}:\n{out}" for label, out in zip(storage_metrics, storage_results)))
+
+            r.h2("VictoriaLogs — Event Counts")
+            rows = [[label, str(n) if n >= 0 else "?"] for label, n in zip(vl_queries, vl_results)]
+            r.table(["Event type", "Count"], rows)
 
         r.h2("Explore Further")
         r.table(
@@ -518,11 +684,19 @@ def phase8_recommendations(
 ) -> None:
     section("PHASE 8 — Recommendations")
 
-    errors         = vl_count("service_name:gastown AND level:error")
-    session_starts = vm_scalar("sum(gastown_session_starts_total)")
-    polecat_spawns = vm_scalar("sum(gastown_polecat_spawns_total)")
-    input_tokens   = vm_scalar("sum(bd_ai_input_tokens_total)")
-    output_tokens  = vm_scalar("sum(bd_ai_output_tokens_total)")
+    with ThreadPoolExecutor(max_workers=QUERY_WORKERS) as pool:
+        futures = {
+            "errors":         pool.submit(vl_count,  "service_name:gastown AND level:error"),
+            "session_starts": pool.submit(vm_scalar, "sum(gastown_session_starts_total)"),
+            "polecat_spawns": pool.submit(vm_scalar, "sum(gastown_polecat_spawns_total)"),
+            "input_tokens":   pool.submit(vm_scalar, "sum(bd_ai_input_tokens_total)"),
+            "output_tokens":  pool.submit(vm_scalar, "sum(bd_ai_output_tokens_total)"),
+        }
+    errors         = futures["errors"].result()
+    session_starts = futures["session_starts"].result()
+    polecat_spawns = futures["polecat_spawns"].result()
+    input_tokens   = futures["input_tokens"].result()
+    output_tokens  = futures["output_tokens"].result()
     total_elapsed  = int(time.time() - test_start)
 
     with Report(REPORTS_DIR / "08-recommendations.md", "Phase 8 — Recommendations") as r:
@@ -665,13 +839,21 @@ def phase8_recommendations(
 
 # ── Main ──────────────────────────────────────────────────────────────────────
 
+# PATH lookups are memoized: repeated checks for the same command are free.
+_which = functools.lru_cache(maxsize=None)(shutil.which)
+
+
 def preflight() -> None:
     errors = []
     for cmd in ("docker", "git", "gt"):
-        if not shutil.which(cmd):
+        if not _which(cmd):
             errors.append(f"Command not found: {cmd}")
-    if not PROMPT_FILE.exists():
+    try:
+        prompt_text()   # also warms the cache for phase 5
+    except OSError:
         errors.append(f"Prompt file not found: {PROMPT_FILE}")
+    except UnicodeDecodeError:
+        errors.append(f"Prompt file is not valid UTF-8: {PROMPT_FILE}")
     if not TRACE_BIN.exists():
         errors.append(f"gastown-trace binary not found: {TRACE_BIN}")
     if errors:
@@ -712,14 +894,20 @@ def write_readme(trace_pid: int) -> None:
 
 
 def main() -> None:
-    global _log_file
+    global _log_fd
 
     preflight()
+    os.environ.update(OTEL_VARS)
 
     REPORTS_DIR.mkdir(parents=True, exist_ok=True)
-    _log_file = REPORTS_DIR / "run.log"
-    (SCRIPT_DIR / "reports" / "latest").unlink(missing_ok=True)
-    (SCRIPT_DIR / "reports" / "latest").symlink_to(REPORTS_DIR)
+    _log_fd = os.open(REPORTS_DIR / "run.log", os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    atexit.register(os.close, _log_fd)
+    # Build the new link aside and rename it over `latest`: rename(2) is
+    # atomic, so readers never see the link missing.
+    tmp_link = SCRIPT_DIR / "reports" / f"latest.{os.getpid()}"
+    tmp_link.unlink(missing_ok=True)
+    tmp_link.symlink_to(REPORTS_DIR)
+    os.replace(tmp_link, SCRIPT_DIR / "reports" / "latest")
 
     log(f"Reports: {REPORTS_DIR}")
     log(f"Symlink: {SCRIPT_DIR / 'reports' / 'latest'}")
@@ -735,8 +923,12 @@ def main() -> None:
     signal.signal(signal.SIGTERM, _cleanup)
 
     # ── Phases ──
-    phase1_reset_otel()
-    phase2_reset_gastown()
+    # Phases 1 and 2 touch disjoint resources (docker stack vs Mayor) and
+    # write separate reports, so run them side by side.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        resets = [pool.submit(phase1_reset_otel), pool.submit(phase2_reset_gastown)]
+    for f in resets:
+        f.result()
 
     trace_proc, _ = phase3_start_otel()
     write_readme(trace_proc.pid)